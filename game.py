@@ -1,5 +1,5 @@
-from collections import defaultdict
-from typing import List, Dict, Optional
+from collections import Counter
+from typing import List, Optional
 import random
 
 
@@ -39,24 +39,23 @@ class CountdownGame:
             raise ValueError(
                 f"Please specify exactly 6 numbers from the set {sorted(CountdownGame.VALID_NUMBERS)}. Big numbers can be specified ones only, Small numbers can be specified twice.")
 
-        # Check the number list is valid. To do this, we'll loop over the numbers provided and count them into a
-        # dictionary. Using defaultdict to automatically initialise all values to 0.
+        # Check the number list is valid. To do this, we'll count how many times each number appears using Counter, then
+        # check the set of numbers and their counts.
         numbers.sort()
-        number_frequencies: Dict[int, int] = defaultdict(lambda: 0)
-        for number in numbers:
-            # Check the numbers are valid according to the list of valid numbers.
-            if number not in CountdownGame.VALID_NUMBERS:
-                raise ValueError(
-                    f"Number {number} is not a valid number. Valid numbers are {sorted(CountdownGame.VALID_NUMBERS)}")
-            # Big numbers can only appear once. If the number has appeared before, raise an error.
-            elif number > 10 and number_frequencies[number] == 1:
-                raise ValueError(f"Small numbers can be specified at most twice. ({number})")
-            # Small numbers can only appear twice. If the number has already been seen twice, raise an error.
-            elif number <= 10 and number_frequencies[number] == 2:
+        number_frequencies = Counter(numbers)
+        # Check the numbers are valid according to the list of valid numbers.
+        invalid_numbers = set(number_frequencies) - CountdownGame.VALID_NUMBERS
+        if invalid_numbers:
+            raise ValueError(
+                f"Number {min(invalid_numbers)} is not a valid number. "
+                f"Valid numbers are {sorted(CountdownGame.VALID_NUMBERS)}")
+        for number, frequency in number_frequencies.items():
+            # Big numbers can only appear once.
+            if number > 10 and frequency > 1:
                 raise ValueError(f"Big numbers can be specified at most once. ({number})")
-            # If none of the above conditions are met, then we're good to increase the counter for this number.
-            else:
-                number_frequencies[number] += 1
+            # Small numbers can only appear twice.
+            if number <= 10 and frequency > 2:
+                raise ValueError(f"Small numbers can be specified at most twice. ({number})")
 
         # At this stage the game inputs have been validated, store them.
         self._numbers = numbers
@@ -75,15 +74,14 @@ class CountdownGame:
         elif not large_numbers:
             large_numbers = random.randint(0, 4)
 
-        # Shuffle the number card decks each time.
-        random.shuffle(CountdownGame.SMALL_NUMBERS)
-        random.shuffle(CountdownGame.BIG_NUMBERS)
         # Generate the target number.
         target = random.randint(100, 999)
 
-        # Create the list of numbers by array slicing, we want the specified number of large numbers, and the remaining
-        # from the 6 as small numbers. The number decks are pre-shuffled above so this should be different each time.
-        numbers = CountdownGame.SMALL_NUMBERS[0: 6 - large_numbers] + CountdownGame.BIG_NUMBERS[0:large_numbers]
+        # Draw the specified number of large numbers, and the remaining from the 6 as small numbers. random.sample picks
+        # from each deck without changing it, so the class level decks are left as they are.
+        small = random.sample(CountdownGame.SMALL_NUMBERS, 6 - large_numbers)
+        big = random.sample(CountdownGame.BIG_NUMBERS, large_numbers)
+        numbers = small + big
         return CountdownGame(numbers, target)
 
     @property
@@ -1,5 +1,6 @@
 from nodes import Operator, OperatorNode, NumberNode
 from game import CountdownGame
+from solvers.iterative_deepening_solver import IterativeDeepeningSolver
 
 if __name__ == '__main__':
     example = OperatorNode(Operator.TIMES, OperatorNode(Operator.MINUS, NumberNode(5), NumberNode(3)), NumberNode(7))
@@ -9,3 +10,7 @@ if __name__ == '__main__':
     random = CountdownGame.generate()
     print(str(fixed))
     print(str(random))
+
+    for game in (fixed, random):
+        solution = IterativeDeepeningSolver(game).solve()
+        print(f"{str(solution)} = {solution.eval()}")
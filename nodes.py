@@ -1,4 +1,6 @@
 from enum import Enum
+from operator import add, mul
+from typing import Callable, Dict
 import abc
 import random
 
@@ -28,12 +30,41 @@ class Operator(Enum):
         return self.value
 
 
+def _safe_sub(left: int, right: int) -> int:
+    """
+    Subtracts right from left, as long as the result isn't negative.
+    :raises: ValueError if the result would be negative.
+    """
+    if left < right:
+        raise ValueError("No stage can be negative.")
+    return left - right
+
+
+def _safe_div(left: int, right: int) -> int:
+    """
+    Divides left by right, as long as there is no remainder as this isn't allowed in countdown rules.
+    :raises: ValueError if the division leaves a remainder.
+    """
+    if left % right != 0:
+        raise ValueError("Division leaves a remainder")
+    return left // right
+
+
+# The function that applies each operator, looked up once when an OperatorNode is created.
+_OP_FNS: Dict[Operator, Callable[[int, int], int]] = {
+    Operator.PLUS: add,
+    Operator.MINUS: _safe_sub,
+    Operator.TIMES: mul,
+    Operator.DIVIDE: _safe_div,
+}
+
+
 class Node(abc.ABC):
     """
     Abstract Base Class (ABC) for a Node for the binary tree that represents a possible solution. Abstract Base Classes
     allow for polymorphic code to expect certain methods or attributes are available on an object that inherits it.
     ABCs should not be instantiated or used directly. This class says that all inheriting subtypes must have an eval
-    method that has no parameters and returns an int, and a clone method that returns a deep copy that of the node.
+    method that has no parameters and returns an int, and a clone method that returns a copy of the node.
 
     An example tree for (5 + 3) * 7 would look like this:
 
@@ -46,8 +77,16 @@ class Node(abc.ABC):
                                   left          right
                                   /                \
                             NumberNode 5       NumberNode 3
+
+    Nodes are treated as immutable, nothing changes a node after it has been created. That means subtrees can safely be
+    shared between trees, and clone can return the node itself rather than copying it.
+
+    Nodes declare __slots__, which stores their attributes in fixed slots rather than a per-instance __dict__. Solvers
+    can create a great many nodes, so this keeps each one small.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def eval(self) -> int:
         """
@@ -59,8 +98,8 @@ class Node(abc.ABC):
     @abc.abstractmethod
     def clone(self) -> 'Node':
         """
-        Returns a deep copy of this node
-        :return: a deep copy of this node
+        Returns a copy of this node
+        :return: a copy of this node
         """
         raise NotImplementedError
 
@@ -70,26 +109,44 @@ class NumberNode(Node):
     Represents a number in a solution. This is a leaf node for the solution tree, that is it has no child nodes.
     """
 
+    __slots__ = ('value', '_v')
+
     def __init__(self, value: int):
         """
         Create a new number node with the given value
         :param value: The value of the node
         """
         self.value = value
+        self._v = value
 
     def eval(self) -> int:
         """
         Returns the value of the node (no children to calculate)
         :return: the value of the node
         """
-        return self.value
+        return self._v
 
     def clone(self) -> 'Node':
         """
-        Returns a copy of this node
+        Returns a copy of this node. Nodes are never changed after they are created, so this is the node itself.
         :return: return a copy of this node
         """
-        return NumberNode(self.value)
+        return self
+
+    def __hash__(self):
+        """
+        Hash on the value, so equal numbers hash the same regardless of which node instance holds them.
+        :return: the hash of the node
+        """
+        return hash(('n', self.value))
+
+    def __eq__(self, other):
+        """
+        Number nodes are equal if they hold the same value.
+        :param other: The object to compare against
+        :return: True if other is a number node with the same value, False otherwise.
+        """
+        return isinstance(other, NumberNode) and self.value == other.value
 
     def __str__(self):
         """
@@ -99,12 +156,31 @@ class NumberNode(Node):
         return str(self.value)
 
 
+# Shared NumberNode instances, one per value, handed out by number_node.
+_NUM_CACHE: Dict[int, NumberNode] = {}
+
+
+def number_node(value: int) -> NumberNode:
+    """
+    Returns the shared number node for the given value, creating it the first time the value is seen. Solvers only ever
+    use a handful of distinct numbers, so sharing one node per value saves creating lots of identical ones.
+    :param value: The value of the node
+    :return: the number node for the value
+    """
+    node = _NUM_CACHE.get(value)
+    if node is None:
+        node = _NUM_CACHE[value] = NumberNode(value)
+    return node
+
+
 class OperatorNode(Node):
     """
     Represent an operation that operate on two subtrees. This is one of the four main mathematical operators, which is
     then performed on the result of evaluating both subtrees.
     """
 
+    __slots__ = ('operator', 'left', 'right', '_fn', '_hash', '_v')
+
     def __init__(self, operator: Operator, left: Node, right: Node):
         """
         Create a new operator node
@@ -115,37 +191,57 @@ class OperatorNode(Node):
         self.operator = operator
         self.left = left
         self.right = right
+        # The function that applies the operator, so eval doesn't need to work it out each time.
+        self._fn = _OP_FNS[operator]
+        # Cached result of eval, None until it has been calculated.
+        self._v = None
+
+        # Work out the structural hash once, up front. For commutative operators the order of the operands doesn't
+        # matter, so sort the child hashes to make a + b and b + a hash the same.
+        h_l, h_r = hash(left), hash(right)
+        if self.commutative and h_l > h_r:
+            h_l, h_r = h_r, h_l
+        self._hash = hash((operator, h_l, h_r))
 
     def eval(self) -> int:
         """
         Evaluate the result of applying the operator to the results of both subtrees.
         :return: The result of applying the operator to the results of both subtrees.
-        :raises: ValueError if there is a division that results in a remainder.
-        """
-        # Calculate the value of the left and right subtrees
-        left, right = self.left.eval(), self.right.eval()
-        # Apply the relevant calculation depending on which operator type the node represents
-        match self.operator:
-            case Operator.PLUS:
-                return left + right
-            case Operator.MINUS:
-                if left < right:
-                    ValueError("No stage can be negative.")
-                return left - right
-            case Operator.TIMES:
-                return left * right
-            case Operator.DIVIDE:
-                # Ensure the division does not leave a remainder as this isn't allowed in countdown rules.
-                if left % right == 0:
-                    return left // right
-                raise ValueError("Division leaves a remainder")
+        :raises: ValueError if a stage is negative or there is a division that results in a remainder.
+        """
+        # Nodes aren't changed after they are created, so once the value has been calculated it can be reused. Invalid
+        # calculations raise before anything is cached, so they will raise again if evaluated a second time.
+        if self._v is None:
+            self._v = self._fn(self.left.eval(), self.right.eval())
+        return self._v
 
     def clone(self) -> 'Node':
         """
-        Returns a deep copy of this node
-        :return: a deep copy of this node
+        Returns a copy of this node. Nodes are never changed after they are created, so this is the node itself, sharing
+        its subtrees.
+        :return: a copy of this node
+        """
+        return self
+
+    def __hash__(self):
+        """
+        Returns the structural hash calculated when the node was created.
+        :return: the hash of the node
+        """
+        return self._hash
+
+    def __eq__(self, other):
+        """
+        Operator nodes are equal if they have the same operator and equal subtrees. For commutative operators the
+        subtrees may also be the other way around.
+        :param other: The object to compare against
+        :return: True if other is a structurally equivalent operator node, False otherwise.
         """
-        return OperatorNode(self.operator, self.left.clone(), self.right.clone())
+        if not isinstance(other, OperatorNode) or self._hash != other._hash or self.operator != other.operator:
+            return False
+        if self.left == other.left and self.right == other.right:
+            return True
+        return self.commutative and self.left == other.right and self.right == other.left
 
     @property
     def precedence(self) -> int:
@@ -0,0 +1,121 @@
+from typing import Dict, List, Optional, Tuple
+
+from nodes import Node, Operator, OperatorNode, number_node
+from solvers import Solver
+
+# An expression as stored in the reachability table. This is either ('n', index) for one of the game numbers, or
+# (operator, left, right) where left and right are themselves expressions. Keeping these as plain tuples means we only
+# build real Node objects once, for the winning expression.
+Expression = Tuple
+
+
+def _build(expression: Expression, numbers: List[int]) -> Node:
+    """
+    Rebuilds a solution tree from an expression tuple stored in the reachability table.
+    :param expression: The expression tuple to rebuild
+    :param numbers: The numbers for the game, used to look up the leaf values by index
+    :return: the root node of the rebuilt solution tree
+    """
+    if expression[0] == 'n':
+        return number_node(numbers[expression[1]])
+    operator, left, right = expression
+    return OperatorNode(operator, _build(left, numbers), _build(right, numbers))
+
+
+def best(numbers: List[int], target: int) -> Optional[Node]:
+    """
+    Finds the expression closest to the target using the "all subsets" dynamic programming approach. Each subset of
+    the numbers is represented as a bitmask, where bit i is set if numbers[i] is used. For every subset we record every
+    value that can be made using exactly those numbers, along with one expression that makes it. A subset's values are
+    found by splitting it into two disjoint, non-empty halves and combining every value of one half with every value
+    of the other.
+    :param numbers: The numbers available for use
+    :param target: The target number to calculate
+    :return: the root node of the solution closest to the target, or None if there are no numbers.
+    """
+    count = len(numbers)
+    reach: List[Dict[int, Expression]] = [{} for _ in range(1 << count)]
+    best_dist, best_expression = None, None
+
+    # Any expression made from a set of numbers is less than the product of (number + 1) over the set. We keep this
+    # product for the numbers each subset leaves unused, called its headroom, to bound what a value could still become.
+    headroom = [1] * (1 << count)
+    for mask in range(1 << count):
+        for i in range(count):
+            if not mask & (1 << i):
+                headroom[mask] *= numbers[i] + 1
+
+    # Visit the subsets in order of how many numbers they use, so both halves of any split are always complete by the
+    # time we need them. This also means the first expression found for the best distance uses as few numbers as
+    # possible, as we only replace it with a strictly closer one.
+    for mask in sorted(range(1, 1 << count), key=lambda m: bin(m).count('1')):
+        values = reach[mask]
+        if mask & (mask - 1) == 0:
+            # A single bit, this subset is just one of the game numbers.
+            index = mask.bit_length() - 1
+            values[numbers[index]] = ('n', index)
+        else:
+            # A value above this limit can never be brought back closer than the best so far. Combining it with anything
+            # made from the unused numbers either keeps it as large, or at most divides it by or subtracts something
+            # smaller than the headroom, and the limit leaves enough room for both. Such values are never recorded.
+            limit = (target + best_dist + 1) * headroom[mask]
+            # Walk the submasks in descending order. Any split (s, mask ^ s) is the same as (mask ^ s, s), so we only
+            # take the half that contains the highest bit, these all come first and stop as soon as s drops below its
+            # complement.
+            s = (mask - 1) & mask
+            while s > (mask ^ s):
+                for a, la in reach[s].items():
+                    for b, lb in reach[mask ^ s].items():
+                        # Put the larger operand first, so minus never goes negative and only one direction of
+                        # division can possibly work. Invalid calculations are then skipped by simple checks.
+                        big, small, lbig, lsmall = (a, b, la, lb) if a >= b else (b, a, lb, la)
+                        # Also skip zero, and anything that just gives back one of the operands such as x * 1, x / 1
+                        # or 2x - x. The same value can always be made from fewer numbers, so it is already recorded
+                        # against a smaller subset, and keeping it here would only grow the table. Zero is never
+                        # recorded, so addition always makes something new.
+                        value = big + small
+                        if value <= limit and value not in values:
+                            values[value] = (Operator.PLUS, lbig, lsmall)
+                        if small != 1:
+                            value = big * small
+                            if value <= limit and value not in values:
+                                values[value] = (Operator.TIMES, lbig, lsmall)
+                        if big != small and big != 2 * small:
+                            value = big - small
+                            if value <= limit and value not in values:
+                                values[value] = (Operator.MINUS, lbig, lsmall)
+                        if small > 1 and big % small == 0 and big != small * small:
+                            value = big // small
+                            if value <= limit and value not in values:
+                                values[value] = (Operator.DIVIDE, lbig, lsmall)
+                # Nothing can beat hitting the target exactly, so stop as soon as this split has made it.
+                if target in values:
+                    return _build(values[target], numbers)
+                s = (s - 1) & mask
+
+        # Check whether anything made from this subset beats the best so far.
+        for value, expression in values.items():
+            dist = abs(value - target)
+            if best_dist is None or dist < best_dist:
+                best_dist, best_expression = dist, expression
+        if best_dist == 0:
+            break
+
+    if best_expression is None:
+        return None
+    return _build(best_expression, numbers)
+
+
+class IterativeDeepeningSolver(Solver):
+    """
+    Solves the game by deepening over how many numbers are used: first every value that can be made from one number,
+    then from two, and so on up to all six. Rather than searching over solution trees directly, this works on the values
+    each subset of the numbers can reach, and only builds a tree for the winning value at the end.
+    """
+
+    def solve(self) -> Node:
+        """
+        Finds the solution closest to the target number.
+        :return: the root node of the solution closest to the target.
+        """
+        return best(self._game.numbers, self._game.target)
@@ -0,0 +1,182 @@
+from typing import List
+
+import numpy as np
+from numba import njit
+
+from nodes import Node, Operator, OperatorNode, number_node
+from solvers import Solver
+
+# Operator codes used in the ops array. Numba works on plain numbers rather than Enums, so the table stores these codes
+# and they are mapped back to Operators when the winning tree is rebuilt. Code 0 marks one of the game numbers.
+_LEAF, _PLUS, _MINUS, _TIMES, _DIVIDE = 0, 1, 2, 3, 4
+_OPERATORS = (None, Operator.PLUS, Operator.MINUS, Operator.TIMES, Operator.DIVIDE)
+
+
+@njit(cache=True)
+def _popcount(mask):
+    """
+    Counts the set bits in a mask, that is how many numbers a subset uses.
+    :param mask: The subset bitmask
+    :return: the number of set bits
+    """
+    count = 0
+    while mask:
+        mask &= mask - 1
+        count += 1
+    return count
+
+
+@njit(cache=True)
+def _grow(array, capacity):
+    """
+    Copies an array into a new, larger array.
+    :param array: The array to copy
+    :param capacity: The length of the new array
+    :return: the new array
+    """
+    grown = np.empty(capacity, np.int64)
+    grown[:len(array)] = array
+    return grown
+
+
+@njit(cache=True)
+def _insert(value, op, left, right, mask, total, values, ops, lefts, rights, table, stamps):
+    """
+    Records a value against the current subset unless it has already been recorded. Duplicates are found with a linear
+    probing hash table over the entries of the current subset. Each slot is stamped with the subset it belongs to, so
+    the table never needs clearing between subsets.
+    :return: the new total number of entries
+    """
+    slot_mask = len(table) - 1
+    slot = (value * 2654435761) & slot_mask
+    while stamps[slot] == mask:
+        if values[table[slot]] == value:
+            return total
+        slot = (slot + 1) & slot_mask
+    stamps[slot] = mask
+    table[slot] = total
+    values[total], ops[total], lefts[total], rights[total] = value, op, left, right
+    return total + 1
+
+
+@njit(cache=True)
+def fill(numbers):
+    """
+    Compiled version of the subset DP in iterative_deepening_solver.best. Rather than a dict per subset, every entry is
+    appended to one set of parallel arrays, with each subset's entries stored contiguously from starts[mask] for
+    counts[mask] entries. The left and right arrays hold the indices of the entries the value was made from, or for a
+    game number, left holds its index in the numbers array.
+    :param numbers: The numbers available for use, as an int64 array
+    :return: the values, ops, lefts, rights, starts and counts arrays
+    """
+    count = len(numbers)
+    size = 1 << count
+    starts = np.zeros(size, np.int64)
+    counts = np.zeros(size, np.int64)
+
+    capacity = 1024
+    values = np.empty(capacity, np.int64)
+    ops = np.empty(capacity, np.int64)
+    lefts = np.empty(capacity, np.int64)
+    rights = np.empty(capacity, np.int64)
+    table = np.empty(1024, np.int64)
+    stamps = np.zeros(1024, np.int64)
+    total = 0
+
+    # Visit the subsets in order of how many numbers they use, so both halves of any split are always complete.
+    for bits in range(1, count + 1):
+        for mask in range(1, size):
+            if _popcount(mask) != bits:
+                continue
+            starts[mask] = total
+
+            if bits == 1:
+                # One of the game numbers, for a single bit mask - 1 has exactly index bits set.
+                index = _popcount(mask - 1)
+                values[total], ops[total], lefts[total], rights[total] = numbers[index], _LEAF, index, -1
+                total += 1
+                counts[mask] = 1
+                continue
+
+            # Each pair of values makes at most four new ones, use that to size the arrays before filling them.
+            bound = 0
+            s = (mask - 1) & mask
+            while s > (mask ^ s):
+                bound += 4 * counts[s] * counts[mask ^ s]
+                s = (s - 1) & mask
+            if total + bound > capacity:
+                while total + bound > capacity:
+                    capacity *= 2
+                values, ops = _grow(values, capacity), _grow(ops, capacity)
+                lefts, rights = _grow(lefts, capacity), _grow(rights, capacity)
+            if 2 * bound > len(table):
+                slots = len(table)
+                while 2 * bound > slots:
+                    slots *= 2
+                table = np.empty(slots, np.int64)
+                stamps = np.zeros(slots, np.int64)
+
+            # Combine each unordered split once, see best() for why this loop condition covers them all.
+            s = (mask - 1) & mask
+            while s > (mask ^ s):
+                other = mask ^ s
+                for i in range(starts[s], starts[s] + counts[s]):
+                    for j in range(starts[other], starts[other] + counts[other]):
+                        a, b = values[i], values[j]
+                        if a >= b:
+                            big, small, i_big, i_small = a, b, i, j
+                        else:
+                            big, small, i_big, i_small = b, a, j, i
+                        # As in best(), skip zero and anything that gives back one of the operands. Zero is never
+                        # stored, so addition always makes something new.
+                        total = _insert(big + small, _PLUS, i_big, i_small, mask, total,
+                                        values, ops, lefts, rights, table, stamps)
+                        if small != 1:
+                            total = _insert(big * small, _TIMES, i_big, i_small, mask, total,
+                                            values, ops, lefts, rights, table, stamps)
+                        if big != small and big != 2 * small:
+                            total = _insert(big - small, _MINUS, i_big, i_small, mask, total,
+                                            values, ops, lefts, rights, table, stamps)
+                        if small > 1 and big % small == 0 and big != small * small:
+                            total = _insert(big // small, _DIVIDE, i_big, i_small, mask, total,
+                                            values, ops, lefts, rights, table, stamps)
+                s = (s - 1) & mask
+            counts[mask] = total - starts[mask]
+
+    return values[:total], ops[:total], lefts[:total], rights[:total], starts, counts
+
+
+def _build(index: int, numbers: List[int], ops: np.ndarray, lefts: np.ndarray, rights: np.ndarray) -> Node:
+    """
+    Rebuilds a solution tree from an entry in the arrays produced by fill.
+    :param index: The index of the entry to rebuild
+    :param numbers: The numbers for the game, used to look up the leaf values
+    :param ops: The ops array from fill
+    :param lefts: The lefts array from fill
+    :param rights: The rights array from fill
+    :return: the root node of the rebuilt solution tree
+    """
+    if ops[index] == _LEAF:
+        return number_node(numbers[lefts[index]])
+    return OperatorNode(_OPERATORS[ops[index]],
+                        _build(lefts[index], numbers, ops, lefts, rights),
+                        _build(rights[index], numbers, ops, lefts, rights))
+
+
+class NumbaSolver(Solver):
+    """
+    The same subset DP as IterativeDeepeningSolver, compiled to native code with Numba. This needs the numpy and numba
+    packages installed. The first solve also pays for compiling fill, which is cached on disk for later runs.
+    """
+
+    def solve(self) -> Node:
+        """
+        Finds the solution closest to the target number.
+        :return: the root node of the solution closest to the target.
+        """
+        numbers = self._game.numbers
+        values, ops, lefts, rights, _, _ = fill(np.array(numbers, dtype=np.int64))
+        # Entries are stored in order of how many numbers they use, so argmin picks the closest value that uses the
+        # fewest numbers.
+        winner = int(np.argmin(np.abs(values - self._game.target)))
+        return _build(winner, numbers, ops, lefts, rights)